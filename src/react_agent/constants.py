@@ -1,24 +1,30 @@
 """Constants used across the react_agent module."""
 
-from react_agent.signatures import CreateInput
-
 DEFAULT_HEADER_ID = "22FC8C5B-CD71-42B7-9DF2-486F577581A9"
 EDIT_EXCLUDE_FIELDS = {"component_id", "file_path", "kind", "response_format"}
 
-EDIT_VALIDATION_FIELDS = {
-    name
-    for name in CreateInput.model_fields
-    if name
-    not in {
-        "file_path",
-        "parent_id",
-        "before_id",
-        "after_id",
-        "kind",
-        "response_format",
-    }
+EDIT_VALIDATION_EXCLUDE_FIELDS = {
+    "file_path",
+    "parent_id",
+    "before_id",
+    "after_id",
+    "kind",
+    "response_format",
 }
 
+# Fields read by CreateInput's model validator; editing any of them requires
+# re-validating the whole component rather than just the changed fields.
+EDIT_CROSS_VALIDATED_FIELDS = frozenset(
+    {"content", "left", "top", "width", "height", "items", "relIn", "relTo"}
+)
+
+# EDIT fields that can move a component between sibling groups or change
+# its order, so the batch must renumber before saving.
+EDIT_RENUMBER_FIELDS = frozenset({"relIn", "orderIndex"})
+
+TITLE_KEYS = ("title", "name", "text", "content")
+SEARCH_KEYS = ("text", "content", "title", "name")
+
 FAKE_ID_PATTERNS = [
     "temp",
     "anchor",
@@ -28,4 +34,4 @@ FAKE_ID_PATTERNS = [
     "mock",
 ]
 
-CACHEABLE_TOOL_NAMES = {"mutate_components"}
\ No newline at end of file
+CACHEABLE_TOOL_NAMES = {"mutate_components"}
@@ -1,10 +1,12 @@
 """Tools exposed to the LangGraph agent, including WSB JSON manipulation."""
 
-from pathlib import Path
+import copy
 from typing import Any, Callable, Dict, List
 
 from langchain.tools import tool
+from pydantic import TypeAdapter
 
+from react_agent.constants import EDIT_RENUMBER_FIELDS
 from react_agent.descriptions import (
     FIND_TOOL_DESCRIPTION,
     LIST_TOOL_DESCRIPTION,
@@ -16,31 +18,42 @@ from react_agent.signatures import (
     ListInput,
     MutateInput,
     Operation,
+    OperationPayload,
     RetrieveInput,
 )
 from react_agent.utils import (
+    build_component_index,
+    build_text_index,
     execute_create_operation,
     execute_edit_operation,
     execute_remove_operation,
     execute_reorder_operation,
-    find_component_by_id,
     flatten_components_list,
     format_component_response,
     generate_id,
-    get_default_page_path,
-    load_page,
+    load_page_for_update,
+    load_page_view,
     renumber_components,
     resolve_alias_references,
+    resolve_page_path,
     save_page,
-    search_components_by_text,
+    search_text_index,
+)
+
+_OPERATIONS_ADAPTER: TypeAdapter[List[OperationPayload]] = TypeAdapter(
+    List[OperationPayload]
 )
 
 
 @tool(description=LIST_TOOL_DESCRIPTION, args_schema=ListInput)
 def list_components(file_path: str | None = None) -> List[Dict[str, Any]]:
     """Return a flat list of components with id, kind, orderIndex, parentId, title."""
-    page = load_page(Path(file_path) if file_path else get_default_page_path())
-    return flatten_components_list(page.get("items", []))
+    rows = load_page_view(
+        resolve_page_path(file_path),
+        "component_list",
+        lambda page: flatten_components_list(page.get("items", [])),
+    )
+    return list(rows)
 
 
 @tool(description=RETRIEVE_TOOL_DESCRIPTION, args_schema=RetrieveInput)
@@ -50,22 +63,33 @@ def retrieve_component(
     response_format: str = "concise",
 ) -> Dict[str, Any] | None:
     """Return a single component by id."""
-    page_path = Path(file_path) if file_path else get_default_page_path()
-    page = load_page(page_path)
-
-    component = find_component_by_id(page.get("items", []), component_id)
+    index = load_page_view(
+        resolve_page_path(file_path),
+        "id_index",
+        lambda page: build_component_index(page.get("items", [])),
+    )
+    component = index.get(component_id)
 
     if component is None:
         return None
 
-    return format_component_response(component, response_format)
+    response = format_component_response(component, response_format)
+    # Detailed output is the cached component itself; hand out a copy so
+    # callers cannot change the shared page.
+    if response is component:
+        response = copy.deepcopy(component)
+    return response
 
 
 @tool(description=FIND_TOOL_DESCRIPTION, args_schema=FindInput)
 def find_component(text: str, file_path: str | None = None) -> List[Dict[str, Any]]:
     """Locate components whose visible text contains a substring."""
-    page = load_page(Path(file_path) if file_path else get_default_page_path())
-    return search_components_by_text(page.get("items", []), text)
+    text_index = load_page_view(
+        resolve_page_path(file_path),
+        "text_index",
+        lambda page: build_text_index(page.get("items", [])),
+    )
+    return search_text_index(text_index, text)
 
 
 @tool(description=MUTATE_TOOL_DESCRIPTION, args_schema=MutateInput)
@@ -92,37 +116,32 @@ def mutate_components(
     Raises:
         ValueError: If any operation fails validation or execution
     """
-    page_path = Path(file_path) if file_path else get_default_page_path()
-    page = load_page(page_path)
+    page_path = resolve_page_path(file_path)
+    page = load_page_for_update(page_path)
+    page_path_str = str(page_path)
 
     results: List[Dict[str, Any]] = []
     normalized_ops: List[Dict[str, Any]] = []
 
-    for idx, op_wrapper in enumerate(operations):
-        op_type = op_wrapper.op if hasattr(op_wrapper, "op") else op_wrapper.get("op")
-        op_payload = (
-            op_wrapper.payload
-            if hasattr(op_wrapper, "payload")
-            else op_wrapper.get("payload")
+    # Tool calls arrive already parsed; direct callers may pass plain dicts.
+    for idx, op_wrapper in enumerate(_OPERATIONS_ADAPTER.validate_python(operations)):
+        # Unset fields keep their model defaults out of EDIT updates.
+        payload_dict = op_wrapper.payload.model_dump(
+            exclude_unset=True, exclude_none=True
         )
-
-        alias = getattr(op_wrapper, "alias", None)
-        if alias is None and isinstance(op_wrapper, dict):
-            alias = op_wrapper.get("alias")
-
-        if hasattr(op_payload, "model_dump"):
-            payload_dict = op_payload.model_dump(exclude_none=True)
-        else:
-            payload_dict = dict(op_payload) if isinstance(op_payload, dict) else {}
-
-        if "orderIds" in payload_dict and "order_ids" not in payload_dict:
-            payload_dict["order_ids"] = payload_dict.pop("orderIds")
-
         normalized_ops.append(
-            {"index": idx, "op": op_type, "payload": payload_dict, "alias": alias}
+            {
+                "index": idx,
+                "op": op_wrapper.op,
+                "payload": payload_dict,
+                "alias": getattr(op_wrapper, "alias", None),
+            }
         )
 
     alias_map: Dict[str, str] = {}
+    index = build_component_index(page.get("items", []))
+    needs_renumber = False
+    dirty = False
 
     for op in normalized_ops:
         if op["op"] == Operation.CREATE or op["op"] == "CREATE":
@@ -188,32 +207,52 @@ def mutate_components(
                     resolve_alias_references(oid, alias_map) for oid in order_ids
                 ]
 
-            payload_dict["file_path"] = str(page_path)
+            payload_dict["file_path"] = page_path_str
             payload_dict["response_format"] = response_format
 
             if op_type == Operation.CREATE or op_type == "CREATE":
-                result = execute_create_operation(page, payload_dict, response_format)
+                result = execute_create_operation(
+                    page, payload_dict, response_format, index
+                )
                 results.append(result)
+                dirty = True
 
             elif op_type == Operation.EDIT or op_type == "EDIT":
-                result = execute_edit_operation(page, payload_dict, response_format)
+                result = execute_edit_operation(
+                    page, payload_dict, response_format, index
+                )
                 results.append(result)
+                if not EDIT_RENUMBER_FIELDS.isdisjoint(payload_dict):
+                    needs_renumber = True
+                dirty = True
 
             elif op_type == Operation.REMOVE or op_type == "REMOVE":
-                result = execute_remove_operation(page, payload_dict)
-                results.append(result)
+                removed = execute_remove_operation(page, payload_dict, index)
+                results.append(removed)
+                needs_renumber |= removed
+                dirty |= removed
 
             elif op_type == Operation.REORDER or op_type == "REORDER":
                 result = execute_reorder_operation(page, payload_dict, response_format)
                 results.append(result)
+                dirty = dirty or bool(result)
 
             else:
                 raise ValueError(
                     f"Unknown operation type at index {op['index']}: {op_type}"
                 )
 
-        renumber_components(page.get("items", []))
-        save_page(page_path, page)
+        # CREATE and REORDER number their own siblings; EDIT only needs a full
+        # renumber when it moves a component or sets orderIndex directly.
+        if needs_renumber:
+            renumber_components(page.get("items", []))
+
+        # Removing missing ids or reordering an empty group leaves nothing to write.
+        if dirty:
+            save_page(page_path, page)
+            # Detailed results point into the page the cache now shares.
+            if (response_format or "concise").lower() == "detailed":
+                results = copy.deepcopy(results)
 
         return results
 
@@ -1,22 +1,45 @@
 """Utility & helper functions."""
 
-import json
-import uuid
+import os
+import re
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from stat import S_IMODE
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
+import orjson
 from langchain.chat_models import init_chat_model
 from langchain_anthropic import convert_to_anthropic_tool
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
+from pydantic import TypeAdapter
 
-from react_agent.builder import build_component, normalize_style_fields
+from react_agent.builder import (
+    STYLE_FIELDS,
+    build_component,
+    normalize_style_fields,
+)
 from react_agent.constants import (
     CACHEABLE_TOOL_NAMES,
     DEFAULT_HEADER_ID,
+    EDIT_CROSS_VALIDATED_FIELDS,
     EDIT_EXCLUDE_FIELDS,
-    EDIT_VALIDATION_FIELDS,
+    EDIT_VALIDATION_EXCLUDE_FIELDS,
     FAKE_ID_PATTERNS,
+    SEARCH_KEYS,
+    TITLE_KEYS,
 )
 from react_agent.signatures import (
     CreateInput,
@@ -26,7 +49,50 @@ from react_agent.signatures import (
     ReorderInput,
 )
 
-_ANTHROPIC_TOOLS_CACHE: List[Dict[str, Any]] | None = None
+T = TypeVar("T")
+
+
+class TextIndex(NamedTuple):
+    """Column-oriented view of the searchable components of a page.
+
+    Row ``i`` of every column describes the same component, in pre-order.
+    ``blob`` joins every row's text so a missing needle is rejected with a
+    single scan.
+    """
+
+    ids: List[Any]
+    kinds: List[Optional[str]]
+    texts: List[str]
+    fields: List[Tuple[Tuple[str, str], ...]]
+    blob: str
+
+
+@dataclass
+class _CachedPage:
+    """A parsed page plus the views derived from it, valid for one file version."""
+
+    mtime_ns: int
+    size: int
+    raw: bytes
+    page: Dict[str, Any]
+    views: Dict[str, Any] = field(default_factory=dict)
+
+
+# Keyed by tool identity; the tools are kept alongside so their ids stay unique.
+# Only the most recent few tool lists are kept; the oldest entry is evicted first.
+_ANTHROPIC_TOOLS_CACHE_SIZE = 8
+_ANTHROPIC_TOOLS_CACHE: Dict[
+    Tuple[int, ...], Tuple[Tuple[Any, ...], List[Dict[str, Any]]]
+] = {}
+# Page paths come from tool arguments, so only the most recently stored few
+# pages are kept; the oldest entry is evicted first.
+_PAGE_CACHE_SIZE = 8
+_PAGE_CACHE: Dict[Path, _CachedPage] = {}
+
+
+_FAKE_ID_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in FAKE_ID_PATTERNS), re.IGNORECASE
+)
 
 
 def get_message_text(msg: BaseMessage) -> str:
@@ -59,11 +125,20 @@ def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     return init_chat_model(model, model_provider=provider)
 
 
-def retrieve_tools(tools: List[Callable]) -> List[Dict[str, Any]]:
+def _convert_tool(tool: Callable[..., Any]) -> Dict[str, Any]:
+    """Convert one tool to Anthropic format, tagging it for prompt caching."""
+    schema = cast(Dict[str, Any], convert_to_anthropic_tool(tool))
+    if schema.get("name") in CACHEABLE_TOOL_NAMES:
+        schema["cache_control"] = {"type": "ephemeral"}
+    return schema
+
+
+def retrieve_tools(tools: List[Callable[..., Any]]) -> List[Dict[str, Any]]:
     """Convert tools to Anthropic format with prompt caching enabled.
 
-    Converts tools once and caches them for reuse across all LLM calls.
-    Applies cache_control only to selected tools to stay under Anthropic limits.
+    Converts each distinct tool list once and caches the result for reuse
+    across all LLM calls. Applies cache_control only to selected tools to stay
+    under Anthropic limits.
 
     Args:
         tools: List of LangChain tool callables to convert.
@@ -71,30 +146,40 @@ def retrieve_tools(tools: List[Callable]) -> List[Dict[str, Any]]:
     Returns:
         List of Anthropic tool schemas with cache_control configured.
     """
-    global _ANTHROPIC_TOOLS_CACHE
-
-    if _ANTHROPIC_TOOLS_CACHE is None:
-        _ANTHROPIC_TOOLS_CACHE = [convert_to_anthropic_tool(tool) for tool in tools]
+    key = tuple(id(tool) for tool in tools)
+    cached = _ANTHROPIC_TOOLS_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
 
-        for tool in _ANTHROPIC_TOOLS_CACHE:
-            if tool.get("name") in CACHEABLE_TOOL_NAMES:
-                tool["cache_control"] = {"type": "ephemeral"}
-
-    return _ANTHROPIC_TOOLS_CACHE
+    anthropic_tools = [_convert_tool(tool) for tool in tools]
+    _ANTHROPIC_TOOLS_CACHE[key] = (tuple(tools), anthropic_tools)
+    if len(_ANTHROPIC_TOOLS_CACHE) > _ANTHROPIC_TOOLS_CACHE_SIZE:
+        del _ANTHROPIC_TOOLS_CACHE[next(iter(_ANTHROPIC_TOOLS_CACHE))]
+    return anthropic_tools
 
 
 def generate_id() -> str:
     """Generate a unique ID for components and pages.
 
+    Builds the random (version 4) UUID text directly from os.urandom rather
+    than going through a uuid.UUID object.
+
     Returns:
         str: A unique UUID in uppercase format.
     """
-    return str(uuid.uuid4()).upper()
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40
+    raw[8] = raw[8] & 0x3F | 0x80
+    h = raw.hex().upper()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
+@cache
 def get_default_page_path() -> Path:
     """Get the default path for the page.json file.
 
+    The path is resolved once per process.
+
     Returns:
         Path: Path to the default page.json file in static/wsb directory.
     """
@@ -102,17 +187,46 @@ def get_default_page_path() -> Path:
     return project_root / "static" / "wsb" / "page.json"
 
 
-def load_page(path: Path) -> Dict[str, Any]:
-    """Load a page from the given path, creating a new one if it doesn't exist.
+def resolve_page_path(file_path: Optional[str]) -> Path:
+    """Return the page path for a tool call, falling back to the default page.
 
     Args:
-        path: Path to the page.json file.
+        file_path: Optional path passed to a tool.
 
     Returns:
-        Dict[str, Any]: The page data structure.
+        Path: The given path, or the default page.json path.
+    """
+    return Path(file_path) if file_path else get_default_page_path()
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson."""
+    return orjson.loads(data)
+
+
+def _dump_json(data: Any, pretty: bool) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson."""
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option)
+
+
+def _cache_page(path: Path, entry: _CachedPage) -> None:
+    """Install a cache entry as the newest one, evicting the oldest past the cap."""
+    _PAGE_CACHE.pop(path, None)
+    _PAGE_CACHE[path] = entry
+    if len(_PAGE_CACHE) > _PAGE_CACHE_SIZE:
+        del _PAGE_CACHE[next(iter(_PAGE_CACHE))]
+
+
+def _load_entry(path: Path) -> _CachedPage:
+    """Return the cache entry for the page at path, (re)loading it if stale.
+
+    A missing, empty, or unparsable file is replaced with a new empty page.
     """
 
-    def _create_page() -> Dict[str, Any]:
+    def _create_page() -> _CachedPage:
         page_id = generate_id()
         template_id = generate_id()
 
@@ -127,29 +241,145 @@ def load_page(path: Path) -> Dict[str, Any]:
         }
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(page, indent=2))
+        return _write_page(path, page)
 
-        return page
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return _create_page()
 
-    if path.exists():
-        text = path.read_text()
-        if text.strip():
-            try:
-                return json.loads(text)
-            except (json.JSONDecodeError, ValueError):
-                pass
+    cached = _PAGE_CACHE.get(path)
+    if (
+        cached is not None
+        and cached.mtime_ns == stat.st_mtime_ns
+        and cached.size == stat.st_size
+    ):
+        return cached
+
+    data = path.read_bytes()
+    if data.strip():
+        try:
+            page: Dict[str, Any] = _parse_json(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            entry = _CachedPage(stat.st_mtime_ns, stat.st_size, data, page)
+            _cache_page(path, entry)
+            return entry
 
     return _create_page()
 
 
-def save_page(path: Path, page: Dict[str, Any]) -> None:
-    """Save a page to the given path.
+def load_page(path: Path) -> Dict[str, Any]:
+    """Load a page from the given path, creating a new one if it doesn't exist.
+
+    Parsed pages are cached per path and reused while the file's mtime and
+    size are unchanged. The cached dict is shared between callers and must
+    be treated as read-only; use load_page_for_update() to get a copy to
+    modify.
+
+    Args:
+        path: Path to the page.json file.
+
+    Returns:
+        Dict[str, Any]: The page data structure.
+    """
+    return _load_entry(path).page
+
+
+def load_page_for_update(path: Path) -> Dict[str, Any]:
+    """Load a private copy of a page that the caller may modify.
+
+    The copy is parsed from the cached file bytes, so changes stay invisible
+    to other callers until save_page() installs the new version. Dropping
+    the copy discards them.
+
+    Args:
+        path: Path to the page.json file.
+
+    Returns:
+        Dict[str, Any]: A freshly parsed page data structure.
+    """
+    page: Dict[str, Any] = _parse_json(_load_entry(path).raw)
+    return page
+
+
+def _write_page(
+    path: Path, page: Dict[str, Any], pretty: Optional[bool] = None
+) -> _CachedPage:
+    """Atomically write a page and install it as the cached version."""
+    if pretty is None:
+        pretty = os.environ.get("WSB_PRETTY_JSON") == "1"
+    data = _dump_json(page, pretty=pretty)
+
+    tmp_path = path.with_name(f".{path.name}.{os.urandom(8).hex()}.tmp")
+    # Created 0o666 so the kernel applies the umask, as open() would.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+            stat = os.fstat(tmp_file.fileno())
+        try:
+            mode = S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    entry = _CachedPage(stat.st_mtime_ns, stat.st_size, data, page)
+    _cache_page(path, entry)
+    return entry
+
+
+def save_page(path: Path, page: Dict[str, Any], pretty: Optional[bool] = None) -> None:
+    """Save a page to the given path and refresh its cache entry.
+
+    Pages are written as compact JSON; set ``WSB_PRETTY_JSON=1`` to indent
+    the output when inspecting it by hand. The JSON goes to a uniquely named
+    temp file next to ``path`` that is then renamed over it, so a crash
+    mid-write never leaves a truncated page behind and concurrent saves do
+    not share a temp file. The temp file is fsynced before the rename so the
+    new contents are on disk before they replace the old page; the rename
+    itself is not fsynced, so a power loss right after a save may still
+    leave the previous version in place.
+
+    The saved dict becomes the shared cached page, so callers must not
+    modify it afterwards.
 
     Args:
         path: Path to save the page.json file.
         page: The page data structure to save.
+        pretty: Indent the output; defaults to the ``WSB_PRETTY_JSON`` setting.
+    """
+    _write_page(path, page, pretty)
+
+
+def load_page_view(path: Path, name: str, build: Callable[[Dict[str, Any]], T]) -> T:
+    """Load a page and return a view derived from it, built once per version.
+
+    Views live on the page's cache entry, so saving or evicting the page
+    discards them along with the stale parse.
+
+    Args:
+        path: Path to the page.json file.
+        name: Cache key for the view.
+        build: Function deriving the view from the loaded page.
+
+    Returns:
+        The cached or freshly built view.
     """
-    path.write_text(json.dumps(page, indent=2))
+    entry = _load_entry(path)
+
+    if name not in entry.views:
+        entry.views[name] = build(entry.page)
+
+    return cast(T, entry.views[name])
 
 
 def get_rel_parent_id(item: Dict[str, Any]) -> Optional[str]:
@@ -160,8 +390,26 @@ def get_rel_parent_id(item: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+def get_component_kind(item: Dict[str, Any]) -> Optional[str]:
+    """Return the component kind, falling back to the legacy type field."""
+    return item.get("kind") or item.get("type")
+
+
+def get_component_title(item: Dict[str, Any]) -> Any:
+    """Return the first non-empty of title/name/text/content.
+
+    Empty values fall through on purpose: TEXT components default ``text`` to
+    ``""`` and keep their visible markup in ``content``.
+    """
+    for key in TITLE_KEYS:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
 def renumber_components(items: list[Dict[str, Any]]) -> None:
-    """Recursively renumber orderIndex for all components.
+    """Renumber orderIndex for all components, including nested items.
 
     Ensures that all components have sequential orderIndex values
     starting from 0 within their sibling group.
@@ -169,17 +417,60 @@ def renumber_components(items: list[Dict[str, Any]]) -> None:
     Args:
         items: List of components to renumber.
     """
-    parent_buckets: dict[Optional[str], list[Dict[str, Any]]] = {}
+    stack = [items]
+
+    while stack:
+        current_items = stack.pop()
+        # Flat pages mix sibling groups in one list, keyed by relIn.id.
+        next_index: Dict[Optional[str], int] = {}
 
+        for item in current_items:
+            parent_id = get_rel_parent_id(item)
+            order_index = next_index.get(parent_id, 0)
+            item["orderIndex"] = order_index
+            next_index[parent_id] = order_index + 1
+            children = item.get("items")
+            if children:
+                stack.append(children)
+
+
+def renumber_siblings(items: List[Dict[str, Any]], parent_id: Optional[str]) -> None:
+    """Renumber orderIndex for the components of one list sharing a parent.
+
+    Cheaper than renumber_components when only a single sibling group
+    changed, e.g. after inserting one component.
+
+    Args:
+        items: List holding the sibling group.
+        parent_id: relIn parent id of the group; None for top-level components.
+    """
+    order_index = 0
     for item in items:
-        parent_id = get_rel_parent_id(item)
-        parent_buckets.setdefault(parent_id, []).append(item)
-        if item.get("items"):
-            renumber_components(item["items"])
+        if get_rel_parent_id(item) == parent_id:
+            item["orderIndex"] = order_index
+            order_index += 1
+
 
-    for siblings in parent_buckets.values():
-        for idx, item in enumerate(siblings):
-            item["orderIndex"] = idx
+def iter_components(items: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield every component in pre-order, descending into nested items.
+
+    Keeps a stack of list iterators rather than recursing, so consumers such
+    as next() stop the walk as soon as they have what they need.
+
+    Args:
+        items: List of component items to walk.
+    """
+    stack = [iter(items)]
+
+    while stack:
+        for item in stack[-1]:
+            yield item
+            children = item.get("items")
+            if children:
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
 
 
 def build_component_index(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -189,19 +480,17 @@ def build_component_index(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, An
         items: List of component items to index.
 
     Returns:
-        Dictionary mapping component ID to component object.
+        Dictionary mapping component ID to component object. When an id is
+        duplicated, the first match in pre-order wins, as in
+        find_component_by_id.
     """
     index: Dict[str, Dict[str, Any]] = {}
 
-    def walk(current_items: List[Dict[str, Any]]) -> None:
-        for item in current_items:
-            item_id = item.get("id")
-            if item_id:
-                index[item_id] = item
-            if item.get("items"):
-                walk(item["items"])
+    for item in iter_components(items):
+        item_id = item.get("id")
+        if item_id:
+            index.setdefault(item_id, item)
 
-    walk(items)
     return index
 
 
@@ -209,13 +498,21 @@ def find_component_by_id(
     items: list[Dict[str, Any]], component_id: str
 ) -> Optional[Dict[str, Any]]:
     """Depth-first search for a component by id."""
-    for item in items:
-        if item.get("id") == component_id:
-            return item
-        child = find_component_by_id(item.get("items", []), component_id)
-        if child:
-            return child
-    return None
+    return next(
+        (item for item in iter_components(items) if item.get("id") == component_id),
+        None,
+    )
+
+
+def lookup_component(
+    page: Dict[str, Any],
+    component_id: str,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Return a component by id, using the prebuilt index when one is given."""
+    if index is not None:
+        return index.get(component_id)
+    return find_component_by_id(page.get("items", []), component_id)
 
 
 def insert_component(
@@ -224,6 +521,7 @@ def insert_component(
     parent_id: str | None = None,
     before_id: str | None = None,
     after_id: str | None = None,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> bool:
     """Insert a component into the page list.
 
@@ -236,6 +534,8 @@ def insert_component(
         parent_id: Optional parent component ID; sets relIn.id when provided.
         before_id: Optional sibling ID to insert before (global ordering).
         after_id: Optional sibling ID to insert after (global ordering).
+        index: Optional id index used to resolve before_id/after_id; the
+            scan is skipped when neither is on the page.
 
     Returns:
         True if insertion was successful.
@@ -244,7 +544,18 @@ def insert_component(
     if parent_id and not component.get("relIn"):
         component["relIn"] = {"id": parent_id}
 
-    if before_id or after_id:
+    if (before_id or after_id) and index is not None:
+        before = index.get(before_id) if before_id else None
+        after = index.get(after_id) if after_id else None
+        if before is not None or after is not None:
+            for idx, item in enumerate(target_list):
+                if item is before:
+                    target_list.insert(idx, component)
+                    return True
+                if item is after:
+                    target_list.insert(idx + 1, component)
+                    return True
+    elif before_id or after_id:
         for idx, item in enumerate(target_list):
             if item.get("id") == before_id:
                 target_list.insert(idx, component)
@@ -270,83 +581,104 @@ def format_component_response(
     Returns:
         Formatted component dictionary.
     """
-    fmt = (response_format or "concise").lower()
-    if fmt == "detailed":
-        return component
-    parent_id = get_rel_parent_id(component)
+    return get_component_formatter(response_format)(component)
+
+
+def _format_concise(component: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the concise id/kind/orderIndex/parentId/title view of a component."""
     return {
         "id": component.get("id"),
-        "kind": component.get("kind") or component.get("type"),
+        "kind": get_component_kind(component),
         "orderIndex": component.get("orderIndex"),
-        "parentId": parent_id,
-        "title": component.get("title")
-        or component.get("name")
-        or component.get("text")
-        or component.get("content"),
+        "parentId": get_rel_parent_id(component),
+        "title": get_component_title(component),
     }
 
 
-def prune_by_ids(page: Dict[str, Any], target_ids: set[str]) -> bool:
-    """Remove components matching target_ids and any descendants referencing them via relIn.
+def _format_detailed(component: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the component unchanged."""
+    return component
+
+
+def get_component_formatter(
+    response_format: str | None,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Pick the formatter for a response format once, for use across many components.
 
     Args:
-        page: Page data structure containing items to prune.
-        target_ids: Set of component IDs to remove.
+        response_format: "concise" (default) or "detailed".
 
     Returns:
-        True if any components were removed, False otherwise.
+        Callable formatting a single component.
     """
-    items = page.get("items", [])
-    parent_map: Dict[Optional[str], List[str]] = {}
+    if (response_format or "concise").lower() == "detailed":
+        return _format_detailed
+    return _format_concise
 
-    def _build_parent_map(current_items: List[Dict[str, Any]]) -> None:
-        for item in current_items:
-            item_id = item.get("id")
-            rel_parent = get_rel_parent_id(item)
-            parent_map.setdefault(rel_parent, []).append(item_id)
 
-            if item.get("items"):
-                _build_parent_map(item["items"])
+def prune_by_ids(
+    page: Dict[str, Any],
+    target_ids: set[str],
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> bool:
+    """Remove components matching target_ids and any descendants referencing them via relIn.
 
-    _build_parent_map(items)
+    Args:
+        page: Page data structure containing items to prune.
+        target_ids: Set of component IDs to remove.
+        index: Optional id index (see build_component_index) to keep in sync;
+            removed components and their nested items are dropped from it.
 
+    Returns:
+        True if any components were removed, False otherwise.
+    """
     ids_to_remove = set(target_ids)
-
-    def _collect_descendants(parent_id: str) -> None:
-        """Recursively mark all descendants of a removed component."""
-        for child_id in parent_map.get(parent_id, []):
-            if child_id not in ids_to_remove:
-                ids_to_remove.add(child_id)
-                _collect_descendants(child_id)
-
-    for target_id in target_ids:
-        _collect_descendants(target_id)
-
     removed_any = False
-
-    def _prune(items_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        nonlocal removed_any
-        new_items: List[Dict[str, Any]] = []
-
-        for item in items_list:
-            item["items"] = _prune(item.get("items", []))
-
-            if item.get("id") in ids_to_remove:
-                removed_any = True
-                continue
-
-            rel_parent = get_rel_parent_id(item)
-
-            if rel_parent in ids_to_remove:
-                removed_any = True
-                continue
-
-            new_items.append(item)
-
-        return new_items
-
-    new_items = _prune(items)
-    page["items"] = new_items
+    rescan = True
+
+    # Compact each list in place behind a write cursor; nothing is copied.
+    # Removed ids are added as we go, so relIn descendants listed after
+    # their parent go in the same pass. Removing an id that an already
+    # kept component carries or points at forces another pass.
+    while rescan:
+        rescan = False
+        kept_refs: set[Any] = set()
+        lists = [page.get("items", [])]
+
+        while lists:
+            items = lists.pop()
+            write = 0
+
+            for item in items:
+                item_id = item.get("id")
+                parent_id = get_rel_parent_id(item)
+                if item_id in ids_to_remove or parent_id in ids_to_remove:
+                    removed_any = True
+                    # Nested items go with their ancestor, so components
+                    # elsewhere whose relIn points at them must go too.
+                    subtree = [item]
+                    while subtree:
+                        node = subtree.pop()
+                        node_id = node.get("id")
+                        if node_id is not None:
+                            ids_to_remove.add(node_id)
+                            rescan = rescan or node_id in kept_refs
+                            if index is not None and index.get(node_id) is node:
+                                del index[node_id]
+                        children = node.get("items")
+                        if children:
+                            subtree.extend(children)
+                    continue
+                items[write] = item
+                write += 1
+                kept_refs.add(item_id)
+                if parent_id is not None:
+                    kept_refs.add(parent_id)
+                children = item.get("items")
+                if children:
+                    lists.append(children)
+
+            del items[write:]
 
     return removed_any
 
@@ -369,7 +701,7 @@ def resolve_alias_references(value: Any, alias_map: Dict[str, str]) -> Any:
 def flatten_components_list(
     items: List[Dict[str, Any]], parent_id: str | None = None
 ) -> List[Dict[str, Any]]:
-    """Recursively flatten component tree into a list with concise info.
+    """Flatten the component tree in pre-order into a list with concise info.
 
     Args:
         items: List of component items to flatten.
@@ -379,36 +711,93 @@ def flatten_components_list(
         Flattened list of components with id, kind, orderIndex, parentId, title.
     """
     result: List[Dict[str, Any]] = []
+    stack = [(item, parent_id) for item in reversed(items)]
+
+    while stack:
+        item, current_parent = stack.pop()
+        result.append(
+            {
+                "id": item.get("id"),
+                "kind": get_component_kind(item),
+                "orderIndex": item.get("orderIndex"),
+                "parentId": get_rel_parent_id(item) or current_parent,
+                "title": get_component_title(item),
+            }
+        )
+        children = item.get("items")
+        if children:
+            item_id = item.get("id")
+            stack.extend((child, item_id) for child in reversed(children))
 
-    def walk(current_items: List[Dict[str, Any]], current_parent: str | None) -> None:
-        for item in current_items:
-            kind = item.get("kind") or item.get("type")
-            rel_parent = get_rel_parent_id(item)
-
-            result.append(
-                {
-                    "id": item.get("id"),
-                    "kind": kind,
-                    "orderIndex": item.get("orderIndex"),
-                    "parentId": rel_parent or current_parent,
-                    "title": item.get("title")
-                    or item.get("name")
-                    or item.get("text")
-                    or item.get("content"),
-                }
-            )
-            if item.get("items"):
-                walk(item["items"], item.get("id"))
+    return result
 
-    walk(items, parent_id)
 
-    return result
+def build_text_index(items: List[Dict[str, Any]]) -> TextIndex:
+    """Lowercase the searchable fields of every component once.
+
+    Args:
+        items: List of component items to index.
+
+    Returns:
+        TextIndex with one row per component that has searchable text: its
+        id, kind, joined lowered text, and ((field, lowered value), ...).
+    """
+    ids: List[Any] = []
+    kinds: List[Optional[str]] = []
+    texts: List[str] = []
+    all_fields: List[Tuple[Tuple[str, str], ...]] = []
+
+    for item in iter_components(items):
+        fields = tuple(
+            (key, value.lower())
+            for key in SEARCH_KEYS
+            if isinstance(value := item.get(key), str)
+        )
+        if fields:
+            ids.append(item.get("id"))
+            kinds.append(get_component_kind(item))
+            texts.append("\n".join(value for _, value in fields))
+            all_fields.append(fields)
+
+    return TextIndex(ids, kinds, texts, all_fields, "\x00".join(texts))
+
+
+def search_text_index(text_index: TextIndex, search_text: str) -> List[Dict[str, Any]]:
+    """Search a prebuilt text index for components containing a substring.
+
+    Args:
+        text_index: Index returned by build_text_index.
+        search_text: Text to search for (case-insensitive).
+
+    Returns:
+        List of matching components with id, kind, and matchField.
+    """
+    hits: List[Dict[str, Any]] = []
+    needle = search_text.lower()
+    if needle not in text_index.blob:
+        return hits
+
+    candidates = [row for row, text in enumerate(text_index.texts) if needle in text]
+
+    for row in candidates:
+        for key, value in text_index.fields[row]:
+            if needle in value:
+                hits.append(
+                    {
+                        "id": text_index.ids[row],
+                        "kind": text_index.kinds[row],
+                        "matchField": key,
+                    }
+                )
+                break
+
+    return hits
 
 
 def search_components_by_text(
     items: List[Dict[str, Any]], search_text: str
 ) -> List[Dict[str, Any]]:
-    """Recursively search components for text matches in visible fields.
+    """Search components for text matches in visible fields.
 
     Args:
         items: List of component items to search.
@@ -417,33 +806,23 @@ def search_components_by_text(
     Returns:
         List of matching components with id, kind, and matchField.
     """
-    hits: List[Dict[str, Any]] = []
-    needle = search_text.lower()
+    return search_text_index(build_text_index(items), search_text)
 
-    def walk(current_items: List[Dict[str, Any]]) -> None:
-        for item in current_items:
-            for key in ("text", "content", "title", "name"):
-                val = item.get(key)
-                if isinstance(val, str) and needle in val.lower():
-                    hits.append(
-                        {
-                            "id": item.get("id"),
-                            "kind": item.get("kind") or item.get("type"),
-                            "matchField": key,
-                        }
-                    )
-                    break
-            if item.get("items"):
-                walk(item["items"])
-
-    walk(items)
-    return hits
+
+def _strip_cdata(value: Any) -> Any:
+    """Unwrap a CDATA-wrapped string, returning anything else unchanged."""
+    if isinstance(value, str):
+        trimmed = value.strip()
+        if trimmed.startswith("<![CDATA[") and trimmed.endswith("]]>"):
+            return trimmed.removeprefix("<![CDATA[").removesuffix("]]>")
+    return value
 
 
 def execute_create_operation(
     page: Dict[str, Any],
     kwargs: Dict[str, Any],
     response_format: str,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """Execute a CREATE operation within a batch (no load/save).
 
@@ -451,6 +830,7 @@ def execute_create_operation(
         page: Page data structure to modify.
         kwargs: Keyword arguments for creating the component.
         response_format: "concise" or "detailed".
+        index: Optional id index used for lookups; the new component is added.
 
     Returns:
         Formatted component response.
@@ -458,14 +838,6 @@ def execute_create_operation(
     Raises:
         ValueError: If validation fails or referenced IDs don't exist.
     """
-
-    def _strip_cdata(value: Any) -> Any:
-        if isinstance(value, str):
-            trimmed = value.strip()
-            if trimmed.startswith("<![CDATA[") and trimmed.endswith("]]>"):
-                return trimmed[len("<![CDATA[") : -len("]]>")]
-        return value
-
     if "content" in kwargs:
         kwargs["content"] = _strip_cdata(kwargs.get("content"))
 
@@ -485,7 +857,7 @@ def execute_create_operation(
             existing_sections = [
                 item
                 for item in page.get("items", [])
-                if (item.get("kind") or item.get("type")) == "SECTION"
+                if get_component_kind(item) == "SECTION"
             ]
             if existing_sections:
                 last_section = max(
@@ -507,7 +879,7 @@ def execute_create_operation(
             if isinstance(rel_to_provided, dict):
                 rel_to_id = rel_to_provided.get("id", "")
                 if (
-                    any(p in rel_to_id.lower() for p in FAKE_ID_PATTERNS)
+                    _FAKE_ID_RE.search(rel_to_id) is not None
                     and rel_to_id != DEFAULT_HEADER_ID
                 ):
                     kwargs["relTo"] = {
@@ -521,7 +893,7 @@ def execute_create_operation(
     )
 
     if parent_id:
-        parent = find_component_by_id(page.get("items", []), parent_id)
+        parent = lookup_component(page, parent_id, index)
         if parent is None:
             raise ValueError(
                 f"relIn/parent_id references unknown id '{parent_id}'. Use list() to pick an existing parent id."
@@ -582,7 +954,7 @@ def execute_create_operation(
         is_template_id = rel_to_target == DEFAULT_HEADER_ID
 
         if rel_to_target and not is_section and not is_template_id:
-            if find_component_by_id(page.get("items", []), rel_to_target) is None:
+            if lookup_component(page, rel_to_target, index) is None:
                 raise ValueError(
                     f"relTo references unknown id '{rel_to_target}'. Use list() to pick an existing sibling/section id."
                 )
@@ -612,15 +984,37 @@ def execute_create_operation(
         parent_id=None,
         before_id=payload.before_id,
         after_id=payload.after_id,
+        index=index,
     )
+    renumber_siblings(page_items, get_rel_parent_id(new_component))
+
+    if index is not None:
+        index.setdefault(new_id, new_component)
 
     return format_component_response(new_component, response_format)
 
 
+@cache
+def _edit_validation_fields() -> frozenset[str]:
+    """Return the CreateInput fields re-validated after an EDIT is applied."""
+    return frozenset(
+        name
+        for name in CreateInput.model_fields
+        if name not in EDIT_VALIDATION_EXCLUDE_FIELDS
+    )
+
+
+@cache
+def _field_adapter(name: str) -> TypeAdapter[Any]:
+    """Return a cached validator for a single CreateInput field."""
+    return TypeAdapter(cast(Any, CreateInput.model_fields[name].annotation))
+
+
 def execute_edit_operation(
     page: Dict[str, Any],
     kwargs: Dict[str, Any],
     response_format: str,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """Execute an EDIT operation within a batch (no load/save).
 
@@ -628,6 +1022,7 @@ def execute_edit_operation(
         page: Page data structure to modify.
         kwargs: Keyword arguments for editing the component.
         response_format: "concise" or "detailed".
+        index: Optional id index used to locate the target.
 
     Returns:
         Formatted component response.
@@ -637,11 +1032,11 @@ def execute_edit_operation(
     """
     payload = EditInput(**kwargs)
 
-    target = find_component_by_id(page.get("items", []), payload.component_id)
+    target = lookup_component(page, payload.component_id, index)
     if target is None:
         raise ValueError(f"Component not found: {payload.component_id}")
 
-    kind_value = target.get("kind") or target.get("type")
+    kind_value = get_component_kind(target)
     if not kind_value:
         raise ValueError("Target component missing kind/type; cannot validate update.")
 
@@ -650,18 +1045,29 @@ def execute_edit_operation(
             f"Kind mismatch: target has '{kind_value}', got '{payload.kind}'."
         )
 
+    # Only fields the caller supplied: model defaults such as inTemplate=False
+    # must not overwrite the target's current values.
     updates = payload.model_dump(
+        include=payload.model_fields_set - EDIT_EXCLUDE_FIELDS,
         exclude_none=True,
-        exclude=EDIT_EXCLUDE_FIELDS,
     )
 
     normalize_style_fields(updates)
     target.update(updates)
     normalize_style_fields(target)
 
+    changed = updates.keys() & _edit_validation_fields()
+    if changed.isdisjoint(EDIT_CROSS_VALIDATED_FIELDS):
+        # EditInput already validated these values; only style fields were
+        # rewritten since (camelCased keys), so only they need re-checking.
+        for name in changed & STYLE_FIELDS:
+            if target.get(name) is not None:
+                _field_adapter(name).validate_python(target[name])
+        return format_component_response(target, response_format)
+
     validation_payload: Dict[str, Any] = {
         field: target[field]
-        for field in EDIT_VALIDATION_FIELDS
+        for field in _edit_validation_fields()
         if field in target and target[field] is not None
     }
 
@@ -674,12 +1080,14 @@ def execute_edit_operation(
 def execute_remove_operation(
     page: Dict[str, Any],
     kwargs: Dict[str, Any],
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> bool:
     """Execute a REMOVE operation within a batch (no load/save).
 
     Args:
         page: Page data structure to modify.
         kwargs: Keyword arguments containing component_id to remove.
+        index: Optional id index to keep in sync with the removal.
 
     Returns:
         True if component was removed, False otherwise.
@@ -687,7 +1095,7 @@ def execute_remove_operation(
     payload = RemoveInput(**kwargs)
     component_id = payload.component_id
 
-    return prune_by_ids(page, {component_id})
+    return prune_by_ids(page, {component_id}, index)
 
 
 def execute_reorder_operation(
@@ -706,43 +1114,35 @@ def execute_reorder_operation(
         List of reordered components in their new order.
     """
     payload = ReorderInput(**kwargs)
+    parent_id = payload.parent_id
+    page_items = page.get("items", [])
 
-    def matches_parent(item: Dict[str, Any]) -> bool:
-        rel_parent = get_rel_parent_id(item)
+    positions: List[int] = []
+    target_list: List[Dict[str, Any]] = []
 
-        return (
-            rel_parent == payload.parent_id
-            if payload.parent_id is not None
-            else rel_parent is None
-        )
+    for idx, item in enumerate(page_items):
+        if get_rel_parent_id(item) == parent_id:
+            positions.append(idx)
+            target_list.append(item)
 
-    target_list = [item for item in page.get("items", []) if matches_parent(item)]
-
-    if not target_list:
+    if not positions:
         return []
 
     id_to_item = {item.get("id"): item for item in target_list}
-    new_list = [id_to_item[i] for i in payload.order_ids if i in id_to_item]
-
-    reordered_ids = {item.get("id") for item in new_list}
+    new_list: List[Dict[str, Any]] = []
+    placed: set[int] = set()
 
-    for item in target_list:
-        if item.get("id") not in reordered_ids:
+    for component_id in payload.order_ids:
+        item = id_to_item.get(component_id)
+        if item is not None and id(item) not in placed:
+            placed.add(id(item))
             new_list.append(item)
 
-    for idx, item in enumerate(new_list):
-        item["orderIndex"] = idx
-
-    sibling_ids = {item.get("id") for item in target_list}
-    new_items: List[Dict[str, Any]] = []
-    new_iter = iter(new_list)
-
-    for item in page.get("items", []):
-        if item.get("id") in sibling_ids:
-            new_items.append(next(new_iter))
-        else:
-            new_items.append(item)
+    new_list.extend(item for item in target_list if id(item) not in placed)
 
-    page["items"] = new_items
+    for order_index, (position, item) in enumerate(zip(positions, new_list)):
+        page_items[position] = item
+        item["orderIndex"] = order_index
 
-    return [format_component_response(item, response_format) for item in new_list]
+    formatter = get_component_formatter(response_format)
+    return [formatter(item) for item in new_list]
@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from react_agent.tools import mutate_components, retrieve_component
+from react_agent.utils import load_page
+
+
+def test_mutate_components_skips_save_when_nothing_changes(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    original = json.dumps({"id": "P1", "items": [{"id": "S1"}]}, indent=4)
+    page_file.write_text(original)
+
+    result = mutate_components.invoke(
+        {
+            "file_path": str(page_file),
+            "operations": [{"op": "REMOVE", "payload": {"component_id": "MISSING"}}],
+        }
+    )
+
+    assert result == [False]
+    assert page_file.read_text() == original
+
+
+def test_mutate_components_edit_keeps_unsupplied_fields(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text(
+        json.dumps(
+            {"id": "P1", "items": [{"id": "T1", "kind": "TEXT", "inTemplate": True}]}
+        )
+    )
+
+    mutate_components.invoke(
+        {
+            "file_path": str(page_file),
+            "operations": [
+                {"op": "EDIT", "payload": {"component_id": "T1", "name": "Intro"}}
+            ],
+        }
+    )
+
+    assert json.loads(page_file.read_text())["items"] == [
+        {"id": "T1", "kind": "TEXT", "inTemplate": True, "name": "Intro"}
+    ]
+
+
+def test_mutate_components_edit_moving_component_renumbers(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    layout = {"left": 0, "top": 0, "width": 10, "height": 10}
+    page_file.write_text(
+        json.dumps(
+            {
+                "id": "P1",
+                "items": [
+                    {"id": "S1", "kind": "SECTION", "relIn": None, "orderIndex": 0},
+                    {
+                        "id": "A",
+                        "kind": "TEXT",
+                        "relIn": {"id": "S1", "left": 0},
+                        "orderIndex": 0,
+                        **layout,
+                    },
+                    {"id": "S2", "kind": "SECTION", "relIn": None, "orderIndex": 1},
+                    {
+                        "id": "B",
+                        "kind": "TEXT",
+                        "relIn": {"id": "S1", "left": 0},
+                        "orderIndex": 1,
+                        **layout,
+                    },
+                    {
+                        "id": "C",
+                        "kind": "TEXT",
+                        "relIn": {"id": "S2", "left": 0},
+                        "orderIndex": 0,
+                        **layout,
+                    },
+                ],
+            }
+        )
+    )
+
+    mutate_components.invoke(
+        {
+            "file_path": str(page_file),
+            "operations": [
+                {
+                    "op": "EDIT",
+                    "payload": {"component_id": "A", "relIn": {"id": "S2", "left": 5}},
+                },
+                {"op": "EDIT", "payload": {"component_id": "C", "orderIndex": 7}},
+            ],
+        }
+    )
+
+    order = {
+        item["id"]: item["orderIndex"]
+        for item in json.loads(page_file.read_text())["items"]
+    }
+    assert order == {"S1": 0, "A": 0, "S2": 1, "B": 0, "C": 1}
+
+
+def test_mutate_components_failed_batch_leaves_cached_page_untouched(
+    tmp_path: Path,
+) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text(json.dumps({"id": "P1", "items": [{"id": "S1"}]}))
+    cached = load_page(page_file)
+    snapshot = json.loads(json.dumps(cached))
+
+    with pytest.raises(ValueError):
+        mutate_components.invoke(
+            {
+                "file_path": str(page_file),
+                "operations": [
+                    {"op": "REMOVE", "payload": {"component_id": "S1"}},
+                    {"op": "EDIT", "payload": {"component_id": "MISSING"}},
+                ],
+            }
+        )
+
+    assert cached == snapshot
+    assert load_page(page_file) is cached
+
+
+def test_detailed_results_do_not_alias_cached_page(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text(
+        json.dumps({"id": "P1", "items": [{"id": "T1", "kind": "TEXT"}]})
+    )
+
+    edited = mutate_components.invoke(
+        {
+            "file_path": str(page_file),
+            "operations": [
+                {"op": "EDIT", "payload": {"component_id": "T1", "name": "Intro"}}
+            ],
+            "response_format": "detailed",
+        }
+    )
+    edited[0]["name"] = "changed"
+    retrieved = retrieve_component.invoke(
+        {
+            "component_id": "T1",
+            "file_path": str(page_file),
+            "response_format": "detailed",
+        }
+    )
+    retrieved["name"] = "changed"
+
+    assert load_page(page_file)["items"] == [
+        {"id": "T1", "kind": "TEXT", "name": "Intro"}
+    ]
@@ -0,0 +1,362 @@
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from react_agent.tools import TOOLS
+from react_agent.utils import (
+    build_component_index,
+    execute_edit_operation,
+    execute_reorder_operation,
+    format_component_response,
+    generate_id,
+    get_component_title,
+    insert_component,
+    iter_components,
+    load_page,
+    load_page_for_update,
+    load_page_view,
+    prune_by_ids,
+    renumber_components,
+    renumber_siblings,
+    retrieve_tools,
+    save_page,
+    search_components_by_text,
+)
+
+
+def test_get_component_title_prefers_title() -> None:
+    item = {"title": "Hero", "name": "Section", "text": "Hello"}
+    assert get_component_title(item) == "Hero"
+
+
+def test_get_component_title_skips_empty_text() -> None:
+    item = {"kind": "TEXT", "text": "", "content": "<p>Hello</p>"}
+    assert get_component_title(item) == "<p>Hello</p>"
+
+
+def test_get_component_title_missing() -> None:
+    assert get_component_title({"id": "A"}) is None
+
+
+def test_generate_id_is_uppercase_uuid4() -> None:
+    component_id = generate_id()
+
+    assert uuid.UUID(component_id).version == 4
+    assert str(uuid.UUID(component_id)).upper() == component_id
+    assert generate_id() != component_id
+
+
+def test_format_component_response_concise() -> None:
+    component = {
+        "id": "TEXT-1",
+        "type": "TEXT",
+        "orderIndex": 2,
+        "relIn": {"id": "SECTION-1"},
+        "name": "Intro",
+    }
+    assert format_component_response(component, None) == {
+        "id": "TEXT-1",
+        "kind": "TEXT",
+        "orderIndex": 2,
+        "parentId": "SECTION-1",
+        "title": "Intro",
+    }
+
+
+def test_insert_component_resolves_anchor_through_index() -> None:
+    items = [{"id": "A"}, {"id": "B"}, {"id": "C"}]
+    index = build_component_index(items)
+
+    assert insert_component({"id": "X"}, items, after_id="B", index=index) is True
+    assert insert_component({"id": "Y"}, items, before_id="A", index=index) is True
+    assert insert_component({"id": "Z"}, items, before_id="NOPE", index=index) is True
+    assert [item["id"] for item in items] == ["Y", "A", "B", "X", "C", "Z"]
+
+
+def test_execute_reorder_operation_only_touches_siblings() -> None:
+    page = {
+        "items": [
+            {"id": "S1", "kind": "SECTION", "relIn": None},
+            {"id": "A", "kind": "TEXT", "relIn": {"id": "S1"}},
+            {"id": "S2", "kind": "SECTION", "relIn": None},
+            {"id": "B", "kind": "TEXT", "relIn": {"id": "S1"}},
+            {"id": "C", "kind": "TEXT", "relIn": {"id": "S1"}},
+        ]
+    }
+
+    result = execute_reorder_operation(
+        page, {"parent_id": "S1", "order_ids": ["C", "A"]}, "concise"
+    )
+
+    assert [row["id"] for row in result] == ["C", "A", "B"]
+    assert [item["id"] for item in page["items"]] == ["S1", "C", "S2", "A", "B"]
+    assert [item["orderIndex"] for item in page["items"][1::2]] == [0, 1]
+
+
+def test_execute_reorder_operation_ignores_duplicate_ids() -> None:
+    page = {"items": [{"id": "A"}, {"id": "B"}, {"id": "C"}]}
+
+    execute_reorder_operation(page, {"order_ids": ["B", "B", "A"]}, "concise")
+
+    assert [item["id"] for item in page["items"]] == ["B", "A", "C"]
+
+
+def test_execute_edit_operation_validates_only_changed_fields() -> None:
+    page = {"items": [{"id": "T1", "kind": "TEXT", "relIn": None}]}
+
+    result = execute_edit_operation(
+        page, {"component_id": "T1", "name": "Intro"}, "concise"
+    )
+
+    assert result["title"] == "Intro"
+    with pytest.raises(ValueError, match="layout"):
+        execute_edit_operation(page, {"component_id": "T1", "left": 10}, "concise")
+
+
+def test_renumber_components_numbers_each_rel_in_group() -> None:
+    items = [
+        {"id": "S1", "relIn": None},
+        {"id": "A", "relIn": {"id": "S1"}, "items": [{"id": "A1"}, {"id": "A2"}]},
+        {"id": "S2", "relIn": None},
+        {"id": "B", "relIn": {"id": "S1"}},
+    ]
+
+    renumber_components(items)
+
+    assert [item["orderIndex"] for item in items] == [0, 0, 1, 1]
+    assert [item["orderIndex"] for item in items[1]["items"]] == [0, 1]
+
+
+def test_renumber_siblings_only_touches_one_group() -> None:
+    items = [
+        {"id": "S1", "relIn": None, "orderIndex": 0},
+        {"id": "A", "relIn": {"id": "S1"}, "orderIndex": 5},
+        {"id": "S2", "relIn": None, "orderIndex": 1},
+        {"id": "B", "relIn": {"id": "S1"}, "orderIndex": 5},
+        {"id": "C", "relIn": {"id": "S2"}, "orderIndex": 7},
+    ]
+
+    renumber_siblings(items, "S1")
+
+    assert [item["orderIndex"] for item in items] == [0, 0, 1, 1, 7]
+
+
+def test_execute_edit_operation_only_applies_supplied_fields() -> None:
+    page = {"items": [{"id": "T1", "kind": "TEXT", "inTemplate": True}]}
+
+    execute_edit_operation(page, {"component_id": "T1", "name": "Intro"}, "concise")
+
+    assert page["items"][0] == {
+        "id": "T1",
+        "kind": "TEXT",
+        "inTemplate": True,
+        "name": "Intro",
+    }
+
+
+def test_search_components_by_text_preserves_document_order() -> None:
+    items = [
+        {
+            "id": "S1",
+            "kind": "SECTION",
+            "name": "Pricing",
+            "items": [{"id": "T1", "kind": "TEXT", "content": "<p>Pro plan</p>"}],
+        },
+        {"id": "B1", "type": "BUTTON", "text": "Go PRO"},
+        {"id": "T2", "kind": "TEXT", "text": "Basic"},
+    ]
+
+    assert search_components_by_text(items, "pro") == [
+        {"id": "T1", "kind": "TEXT", "matchField": "content"},
+        {"id": "B1", "kind": "BUTTON", "matchField": "text"},
+    ]
+
+
+def test_search_components_by_text_empty_or_missing_needle() -> None:
+    items = [{"id": "T1", "kind": "TEXT", "text": "Hello"}, {"id": "S1"}]
+
+    assert search_components_by_text(items, "") == [
+        {"id": "T1", "kind": "TEXT", "matchField": "text"}
+    ]
+    assert search_components_by_text(items, "bye") == []
+
+
+def test_prune_by_ids_removes_rel_in_descendants() -> None:
+    page = {
+        "items": [
+            {"id": "GRANDCHILD", "relIn": {"id": "CHILD"}},
+            {"id": "S1", "relIn": None},
+            {"id": "CHILD", "relIn": {"id": "S1"}},
+            {"id": "S2", "relIn": None, "items": [{"id": "NESTED"}]},
+        ]
+    }
+
+    root_items = page["items"]
+
+    assert prune_by_ids(page, {"S1"}) is True
+    assert page["items"] is root_items
+    assert [item["id"] for item in page["items"]] == ["S2"]
+    assert [item["id"] for item in page["items"][0]["items"]] == ["NESTED"]
+    assert prune_by_ids(page, {"MISSING"}) is False
+
+    nested_parent = {
+        "items": [
+            {"id": "Y", "relIn": {"id": "N"}},
+            {"id": "A", "relIn": None, "items": [{"id": "N", "relIn": {"id": "A"}}]},
+            {"id": "Z", "relIn": {"id": "N"}},
+        ]
+    }
+    index = build_component_index(nested_parent["items"])
+
+    assert prune_by_ids(nested_parent, {"A"}, index) is True
+    assert nested_parent["items"] == []
+    assert index == {}
+
+
+def test_load_page_reuses_cached_page_until_file_changes(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text(json.dumps({"id": "P1", "items": []}))
+
+    page = load_page(page_file)
+    assert load_page(page_file) is page
+
+    page_file.write_text(json.dumps({"id": "P1", "items": [{"id": "S1"}]}))
+    reloaded = load_page(page_file)
+    assert reloaded is not page
+    assert reloaded["items"] == [{"id": "S1"}]
+
+
+def test_load_page_cache_is_bounded(tmp_path: Path) -> None:
+    files = [tmp_path / f"page{number}.json" for number in range(10)]
+    for page_file in files:
+        page_file.write_text(json.dumps({"id": page_file.stem, "items": []}))
+
+    first = load_page(files[0])
+    for page_file in files[1:]:
+        load_page(page_file)
+
+    assert load_page(files[-1]) is load_page(files[-1])
+    assert load_page(files[0]) is not first
+    assert load_page(files[0]) == first
+
+
+def test_save_page_refreshes_cache(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page = {"id": "P1", "items": [{"id": "S1"}]}
+
+    save_page(page_file, page)
+    assert load_page(page_file) is page
+
+    update = load_page_for_update(page_file)
+    assert update is not page
+    update["items"].append({"id": "S2"})
+    assert load_page(page_file)["items"] == [{"id": "S1"}]
+
+    save_page(page_file, update)
+    assert load_page(page_file) is update
+
+
+def test_save_page_replaces_file_without_leaving_temp(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text("stale")
+
+    save_page(page_file, {"id": "P1", "items": []})
+
+    assert json.loads(page_file.read_text())["id"] == "P1"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["page.json"]
+
+
+def test_save_page_keeps_existing_file_mode(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    page_file.write_text("{}")
+    page_file.chmod(0o640)
+
+    save_page(page_file, {"id": "P1", "items": []})
+
+    assert page_file.stat().st_mode & 0o777 == 0o640
+
+
+def test_load_page_creates_missing_page(tmp_path: Path) -> None:
+    page_file = tmp_path / "nested" / "page.json"
+
+    page = load_page(page_file)
+
+    assert page["items"] == []
+    assert json.loads(page_file.read_text())["id"] == page["id"]
+
+
+def test_save_page_writes_compact_json_unless_pretty(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    page_file = tmp_path / "page.json"
+    page = {"id": "P1", "name": "Café", "items": []}
+    pretty_text = json.dumps(page, indent=2, ensure_ascii=False)
+
+    monkeypatch.delenv("WSB_PRETTY_JSON", raising=False)
+    save_page(page_file, page)
+    assert page_file.read_text(encoding="utf-8") == (
+        '{"id":"P1","name":"Café","items":[]}'
+    )
+
+    save_page(page_file, page, pretty=True)
+    assert page_file.read_text(encoding="utf-8") == pretty_text
+
+    monkeypatch.setenv("WSB_PRETTY_JSON", "1")
+    save_page(page_file, page)
+    assert page_file.read_text(encoding="utf-8") == pretty_text
+
+
+def test_iter_components_walks_nested_items_in_pre_order() -> None:
+    items = [
+        {"id": "A", "items": [{"id": "A1", "items": [{"id": "A1a"}]}, {"id": "A2"}]},
+        {"id": "B", "items": []},
+    ]
+
+    assert [item["id"] for item in iter_components(items)] == [
+        "A",
+        "A1",
+        "A1a",
+        "A2",
+        "B",
+    ]
+
+
+def test_load_page_view_is_rebuilt_after_save(tmp_path: Path) -> None:
+    page_file = tmp_path / "page.json"
+    save_page(page_file, {"id": "P1", "items": [{"id": "S1"}]})
+    builds: list[int] = []
+
+    def count_items(page: dict) -> int:
+        builds.append(1)
+        return len(page["items"])
+
+    assert load_page_view(page_file, "count", count_items) == 1
+    assert load_page_view(page_file, "count", count_items) == 1
+    assert len(builds) == 1
+
+    page = load_page_for_update(page_file)
+    page["items"].append({"id": "S2"})
+    save_page(page_file, page)
+
+    assert load_page_view(page_file, "count", count_items) == 2
+    assert len(builds) == 2
+
+
+def test_retrieve_tools_caches_per_tool_list() -> None:
+    converted = retrieve_tools(TOOLS)
+
+    assert retrieve_tools(TOOLS) is converted
+    assert [tool["name"] for tool in retrieve_tools(TOOLS[:1])] == [
+        converted[0]["name"]
+    ]
+
+
+def test_retrieve_tools_cache_is_bounded() -> None:
+    first = retrieve_tools(TOOLS)
+    for count in range(1, 10):
+        retrieve_tools(TOOLS[:1] * count)
+
+    assert retrieve_tools(TOOLS) is not first
+    assert retrieve_tools(TOOLS) == first